@@ -8,17 +8,72 @@ This module contains the main logic for the Actor, including:
 
 from __future__ import annotations
 
-import json
-from typing import Any
+import asyncio
+import hashlib
+import re
+from collections.abc import Callable
 
 from apify import Actor
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from src.models import TravelSearchCriteria
-from src.tools import BookingScraperTool, SearchParameterExtractorTool
+from src.tools import get_booking_scraper, get_search_parameter_extractor, normalize_query, parse_simple_query
 
+# Named key-value store so extracted parameters survive across Actor runs
+LLM_CACHE_STORE_NAME = 'booking-advisor-llm-cache'
+# Bump when TravelSearchCriteria or the extraction prompt changes, so stale entries are not reused
+LLM_CACHE_KEY_PREFIX = 'llm-cache-v1'
 
-async def extract_search_parameters(query: str, currency: str = 'USD', language: str = 'en-gb', max_results: int = 10) -> TravelSearchCriteria:
+# Number of results sent to the dataset per push request
+PUSH_DATA_BATCH_SIZE = 25
+
+# Any hint of a price or rating filter, such queries are not searched speculatively
+_PRICE_OR_RATING_PATTERN = re.compile(
+    r'[$€£\d]|\b(?:price|cheap|budget|under|below|above|over|less|more|rating|rated|stars?|reviews?)\b',
+    re.IGNORECASE,
+)
+
+# Capitalized place name following a preposition, e.g. "a suite in New York"
+_LOCATION_PATTERN = re.compile(r"\b(?:in|at|near|to)\s+([A-Z][\w'-]*(?:\s+[A-Z][\w'-]*)*)")
+
+
+def heuristic_location(query: str) -> str | None:
+    """Guess the destination from a query without calling the LLM.
+
+    Args:
+        query: The natural language search query.
+
+    Returns:
+        The first capitalized place name following a preposition, or None if there is none.
+    """
+    if match := _LOCATION_PATTERN.search(query):
+        return match.group(1)
+    return None
+
+
+def _scraper_inputs_match(preliminary: TravelSearchCriteria, criteria: TravelSearchCriteria) -> bool:
+    """Check whether a scrape for the preliminary criteria is valid for the extracted ones."""
+    return (
+        preliminary.location.strip().lower() == criteria.location.strip().lower()
+        and preliminary.min_price == criteria.min_price
+        and preliminary.max_price == criteria.max_price
+        and preliminary.min_rating == criteria.min_rating
+    )
+
+
+async def _cancel_search(scraper_task: asyncio.Task) -> None:
+    """Cancel a speculative search and wait until its remote run is aborted."""
+    scraper_task.cancel()
+    await asyncio.gather(scraper_task, return_exceptions=True)
+
+
+async def extract_search_parameters(
+    query: str,
+    currency: str = 'USD',
+    language: str = 'en-gb',
+    max_results: int = 10,
+    on_llm_path: Callable[[], None] | None = None
+) -> TravelSearchCriteria:
     """Extract structured search parameters from a natural language query.
 
     Args:
@@ -26,19 +81,43 @@ async def extract_search_parameters(query: str, currency: str = 'USD', language:
         currency: Currency for prices (default: USD)
         language: Language for results (default: en-gb)
         max_results: Maximum number of results to return (default: 10)
+        on_llm_path: Called when the query is not parsed locally, before the cache and LLM are consulted
 
     Returns:
         TravelSearchCriteria object with the extracted search parameters.
     """
-    extractor_tool = SearchParameterExtractorTool()
-    extracted_params = extractor_tool._run(query)
-    
+    # Simple queries are parsed locally, without the key-value store round-trips
+    if (extracted_params := parse_simple_query(query)) is not None:
+        Actor.log.info(f'Parsed parameters without LLM: {extracted_params}')
+    else:
+        Actor.log.info('Query not parsed locally, extracting parameters with LLM')
+        if on_llm_path is not None:
+            on_llm_path()
+        query_hash = hashlib.sha256(normalize_query(query).encode()).hexdigest()
+        cache_key = f'{LLM_CACHE_KEY_PREFIX}-{query_hash}'
+        cache_store = await Actor.open_key_value_store(name=LLM_CACHE_STORE_NAME)
+
+        extracted_params = None
+        if (cached_params := await cache_store.get_value(cache_key)) is not None:
+            try:
+                extracted_params = TravelSearchCriteria.model_validate(cached_params)
+                Actor.log.info('Using cached search parameters')
+            except ValidationError as e:
+                Actor.log.warning(f'Ignoring invalid cached search parameters: {str(e)}')
+
+        if extracted_params is None:
+            # Off the event loop, so the speculative search keeps running during the LLM call
+            extracted_params = await asyncio.to_thread(get_search_parameter_extractor()._run, query)
+            # Only persist successful extractions, the parsing fallback has no location
+            if extracted_params.location:
+                await cache_store.set_value(cache_key, extracted_params.model_dump(mode='json'))
+
     # Override with input configuration
-    extracted_params.currency = currency
-    extracted_params.language = language
-    extracted_params.max_results = max_results
-    
-    return extracted_params
+    return extracted_params.model_copy(update={
+        'currency': currency,
+        'language': language,
+        'max_results': max_results
+    })
 
 
 async def main() -> None:
@@ -69,21 +148,51 @@ async def main() -> None:
         
         Actor.log.info(f'Using configuration - Currency: {currency}, Language: {language}, Max Results: {max_results}')
 
+        Actor.log.info('Initializing property search')
+        booking_scraper = get_booking_scraper()
+        preliminary_criteria: TravelSearchCriteria | None = None
+        scraper_task: asyncio.Task | None = None
+
+        def start_preliminary_search() -> None:
+            """Speculatively search a guessed location while the LLM extracts the criteria."""
+            nonlocal preliminary_criteria, scraper_task
+            # Price and rating filters cannot be guessed, such a search would almost never be reusable
+            if _PRICE_OR_RATING_PATTERN.search(search_query) or not (location := heuristic_location(search_query)):
+                return
+            preliminary_criteria = TravelSearchCriteria(
+                location=location,
+                currency=currency,
+                language=language,
+                max_results=max_results
+            )
+            Actor.log.info(f'Starting preliminary search for: {location}')
+            scraper_task = asyncio.create_task(booking_scraper._arun(preliminary_criteria))
+
         # Extract search parameters with configuration
         Actor.log.info('Extracting search parameters')
-        search_criteria = await extract_search_parameters(
-            search_query,
-            currency=currency,
-            language=language,
-            max_results=max_results
-        )
+        try:
+            search_criteria = await extract_search_parameters(
+                search_query,
+                currency=currency,
+                language=language,
+                max_results=max_results,
+                on_llm_path=start_preliminary_search
+            )
+        except Exception:
+            if scraper_task is not None:
+                await _cancel_search(scraper_task)
+            raise
         Actor.log.info(f'Created search criteria: {search_criteria}')
 
-        # Initialize and execute search
-        Actor.log.info('Initializing property search')
-        booking_scraper = BookingScraperTool()
         try:
-            search_results = booking_scraper._run(search_criteria)
+            if scraper_task is not None and _scraper_inputs_match(preliminary_criteria, search_criteria):
+                Actor.log.info('Preliminary search matches the extracted criteria')
+                search_results = await scraper_task
+            else:
+                if scraper_task is not None:
+                    Actor.log.info('Preliminary search does not match the extracted criteria, searching again')
+                    await _cancel_search(scraper_task)
+                search_results = await booking_scraper._arun(search_criteria)
             Actor.log.info(f'Found {len(search_results)} properties')
         except Exception as e:
             msg = f'Property search failed: {str(e)}'
@@ -91,59 +200,16 @@ async def main() -> None:
             raise RuntimeError(msg)
 
         # Convert search results to plain objects before storing
-        serialized_results = []
-        for result in search_results:
-            if hasattr(result, '__dict__'):
-                serialized_results.append(result.__dict__)
-            elif isinstance(result, dict):
-                serialized_results.append(result)
-            else:
-                serialized_results.append(json.loads(json.dumps(result, default=lambda o: o.__dict__)))
+        serialized_results = [
+            result.model_dump(mode='json', by_alias=True) if isinstance(result, BaseModel) else result
+            for result in search_results
+        ]
 
         # Store results
         Actor.log.info(f'Storing {len(serialized_results)} results')
-        await Actor.push_data(serialized_results)
+        # Push in batches to keep request payloads small, sequentially so the dataset keeps the search order
+        for batch_start in range(0, len(serialized_results), PUSH_DATA_BATCH_SIZE):
+            await Actor.push_data(serialized_results[batch_start:batch_start + PUSH_DATA_BATCH_SIZE])
         await Actor.charge('task-completed')
 
         Actor.log.info('Successfully processed search query and stored results!')
-
-
-def calculate_match_score(property: Any, criteria: TravelSearchCriteria) -> float:
-    """Calculate how well a property matches the search criteria.
-
-    Args:
-        property: The property to evaluate.
-        criteria: The search criteria to match against.
-
-    Returns:
-        A score from 0-100 indicating how well the property matches the criteria.
-    """
-    score = 0.0
-    
-    # Location match (base score)
-    score += 50.0
-    
-    # Price range match (up to 20 points)
-    if criteria.min_price is not None and criteria.max_price is not None:
-        if criteria.min_price <= property.price <= criteria.max_price:
-            score += 20.0
-        else:
-            price_distance = min(
-                abs(property.price - criteria.min_price),
-                abs(property.price - criteria.max_price)
-            )
-            score += max(0, 20.0 - (price_distance / criteria.max_price) * 20.0)
-    
-    # Rating match (up to 15 points)
-    if criteria.min_rating is not None and property.rating is not None:
-        if property.rating >= criteria.min_rating:
-            score += 15.0
-        else:
-            score += max(0, 15.0 - (criteria.min_rating - property.rating) * 5.0)
-    
-    # Room type match (up to 15 points)
-    if criteria.room_type and property.room_type:
-        if criteria.room_type.lower() in property.room_type.lower():
-            score += 15.0
-    
-    return min(100.0, score)
\ No newline at end of file
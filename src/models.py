@@ -7,7 +7,9 @@ Resources:
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field, RootModel
+from functools import cached_property
+
+from pydantic import BaseModel, ConfigDict, Field, RootModel
 
 
 class CategoryReview(BaseModel):
@@ -30,6 +32,8 @@ class PropertyAddress(BaseModel):
 class BookingProperty(BaseModel):
     """Booking.com Property Pydantic model."""
 
+    model_config = ConfigDict(extra='ignore', populate_by_name=True)
+
     name: str = Field(..., description='The name of the property')
     url: str = Field(..., description='The booking URL of the property')
     description: str | None = Field(None, description='Detailed description of the property')
@@ -49,6 +53,16 @@ class BookingProperty(BaseModel):
     image: str | None = Field(None, description='Main property image URL')
     images: list[str] | None = Field(None, description='Additional property image URLs')
 
+    @cached_property
+    def room_type_lower(self) -> str | None:
+        """Lowercased room type, computed once per property for case-insensitive matching."""
+        return self.room_type.lower() if self.room_type else None
+
+    @cached_property
+    def amenities_set(self) -> frozenset[str]:
+        """Lowercased amenities, computed once per property for constant-time membership checks."""
+        return frozenset(amenity.lower() for amenity in self.amenities or ())
+
 
 class BookingProperties(RootModel):
     """Root model for list of BookingProperties."""
@@ -59,11 +73,14 @@ class BookingProperties(RootModel):
 class TravelSearchCriteria(BaseModel):
     """Model for parsed travel search criteria."""
 
+    model_config = ConfigDict(frozen=True)
+
     location: str = Field(..., description='Destination location')
     rooms: int = Field(default=1, description='Number of rooms required')
     min_price: float | None = Field(None, description='Minimum price per night')
     max_price: float | None = Field(None, description='Maximum price per night')
     min_rating: float | None = Field(None, description='Minimum rating required (e.g., 4.0)')
+    room_type: str | None = Field(None, description='Preferred type of room/accommodation')
     currency: str = Field(default='USD', description='Currency for prices')
     language: str = Field(default='en-gb', description='Language for results')
     max_results: int = Field(default=10, description='Maximum number of results to return')
\ No newline at end of file
@@ -0,0 +1,258 @@
+"""This module scores how well properties match the search criteria.
+
+Scoring a single property is done in plain Python, bulk scoring of a whole
+result batch runs over column arrays as branchless NumPy mask arithmetic.
+The compiled Numba kernel is an opt-in path used only when Numba is installed,
+which the Actor image does not do, and it has no test coverage against `calculate_match_score`.
+Resources:
+- https://numba.readthedocs.io/en/stable/user/parallel.html
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+
+from src.models import BookingProperty, TravelSearchCriteria
+
+try:
+    from numba import njit, prange
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+def calculate_match_score(property: BookingProperty, criteria: TravelSearchCriteria) -> float:
+    """Calculate how well a property matches the search criteria.
+
+    Args:
+        property: The property to evaluate.
+        criteria: The search criteria to match against.
+
+    Returns:
+        A score from 0-100 indicating how well the property matches the criteria.
+    """
+    return _match_score(property, criteria, _criteria_room_type(criteria))
+
+
+def _criteria_room_type(criteria: TravelSearchCriteria) -> str | None:
+    """Lowercase the searched room type once so batch scoring does not redo it per property."""
+    return criteria.room_type.lower() if criteria.room_type else None
+
+
+def _match_score(property: BookingProperty, criteria: TravelSearchCriteria, criteria_room_type: str | None) -> float:
+    """Calculate the match score given the already lowercased searched room type."""
+    score = 0.0
+    
+    # Location match (base score)
+    score += 50.0
+    
+    # Price range match (up to 20 points)
+    if criteria.min_price is not None and criteria.max_price is not None:
+        if criteria.min_price <= property.price <= criteria.max_price:
+            score += 20.0
+        else:
+            price_distance = min(
+                abs(property.price - criteria.min_price),
+                abs(property.price - criteria.max_price)
+            )
+            score += max(0, 20.0 - (price_distance / criteria.max_price) * 20.0)
+    
+    # Rating match (up to 15 points)
+    if criteria.min_rating is not None and property.rating is not None:
+        if property.rating >= criteria.min_rating:
+            score += 15.0
+        else:
+            score += max(0, 15.0 - (criteria.min_rating - property.rating) * 5.0)
+    
+    # Room type match (up to 15 points)
+    if criteria_room_type and property.room_type_lower:
+        if criteria_room_type in property.room_type_lower:
+            score += 15.0
+    
+    return min(100.0, score)
+
+
+def _upper_bound(property: BookingProperty, criteria: TravelSearchCriteria) -> float:
+    """Cheaply bound `calculate_match_score` from above.
+
+    Skips the price distance and room type string match, assuming both score in full.
+    """
+    bound = 50.0
+    if criteria.min_price is not None and criteria.max_price is not None:
+        bound += 20.0
+    if criteria.min_rating is not None and property.rating is not None:
+        if property.rating >= criteria.min_rating:
+            bound += 15.0
+        else:
+            bound += max(0, 15.0 - (criteria.min_rating - property.rating) * 5.0)
+    if criteria.room_type and property.room_type:
+        bound += 15.0
+    return min(100.0, bound)
+
+
+def top_matches(
+    properties: Iterable[BookingProperty],
+    criteria: TravelSearchCriteria,
+    k: int,
+    min_score: float = 0.0,
+) -> list[tuple[float, BookingProperty]]:
+    """Find the best matching properties, fully scoring only as many as needed.
+
+    Properties whose upper bound is below `min_score` are discarded up front, the rest are
+    scored in order of decreasing upper bound until no remaining bound can beat the k-th best score.
+
+    Args:
+        properties: The properties to evaluate.
+        criteria: The search criteria to match against.
+        k: Maximum number of matches to return.
+        min_score: Minimum score a property needs to be returned.
+
+    Returns:
+        Up to k (score, property) pairs, best first. Ties keep the original property order.
+    """
+    if k <= 0:
+        return []
+
+    criteria_room_type = _criteria_room_type(criteria)
+    candidates = []
+    for index, property in enumerate(properties):
+        if (bound := _upper_bound(property, criteria)) >= min_score:
+            candidates.append((-bound, index, property))
+    candidates.sort(key=lambda candidate: candidate[:2])
+
+    # Min-heap of the best matches so far, the worst one (lowest score, latest index) on top
+    best: list[tuple[float, int, BookingProperty]] = []
+    for negated_bound, index, property in candidates:
+        if len(best) == k and -negated_bound < best[0][0]:
+            break
+        score = _match_score(property, criteria, criteria_room_type)
+        if score < min_score:
+            continue
+        entry = (score, -index, property)
+        if len(best) < k:
+            heapq.heappush(best, entry)
+        elif entry[:2] > best[0][:2]:
+            heapq.heapreplace(best, entry)
+
+    best.sort(key=lambda entry: entry[:2], reverse=True)
+    return [(score, property) for score, _, property in best]
+
+
+if _NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _score_kernel(
+        prices: np.ndarray,
+        ratings: np.ndarray,
+        room_match: np.ndarray,
+        has_price_range: bool,
+        min_price: float,
+        max_price: float,
+        has_min_rating: bool,
+        min_rating: float,
+    ) -> np.ndarray:
+        """Score column arrays of properties, mirrors `calculate_match_score` branch for branch."""
+        scores = np.empty(prices.shape[0], dtype=np.float64)
+        for i in prange(prices.shape[0]):
+            # Location match (base score)
+            score = 50.0
+
+            # Price range match (up to 20 points)
+            if has_price_range:
+                price = prices[i]
+                if min_price <= price <= max_price:
+                    score += 20.0
+                else:
+                    price_distance = min(abs(price - min_price), abs(price - max_price))
+                    score += max(0.0, 20.0 - (price_distance / max_price) * 20.0)
+
+            # Rating match (up to 15 points), NaN marks a missing rating
+            rating = ratings[i]
+            if has_min_rating and not np.isnan(rating):
+                if rating >= min_rating:
+                    score += 15.0
+                else:
+                    score += max(0.0, 15.0 - (min_rating - rating) * 5.0)
+
+            # Room type match (up to 15 points)
+            if room_match[i]:
+                score += 15.0
+
+            scores[i] = min(100.0, score)
+        return scores
+
+
+def score_prices(prices: np.ndarray, min_price: float, max_price: float) -> np.ndarray:
+    """Score the price range match of each price, up to 20 points.
+
+    Args:
+        prices: Prices per night.
+        min_price: Minimum price of the searched range.
+        max_price: Maximum price of the searched range.
+
+    Returns:
+        Array of price scores, in the order of `prices`.
+    """
+    in_range = (prices >= min_price) & (prices <= max_price)
+    price_distance = np.minimum(np.abs(prices - min_price), np.abs(prices - max_price))
+    return np.where(in_range, 20.0, np.maximum(0.0, 20.0 - (price_distance / max_price) * 20.0))
+
+
+def score_ratings(ratings: np.ndarray, min_rating: float) -> np.ndarray:
+    """Score the rating match of each rating, up to 15 points.
+
+    Args:
+        ratings: Property ratings, NaN where a property has no rating.
+        min_rating: Minimum rating required.
+
+    Returns:
+        Array of rating scores, in the order of `ratings`.
+    """
+    scores = np.where(ratings >= min_rating, 15.0, np.maximum(0.0, 15.0 - (min_rating - ratings) * 5.0))
+    return np.where(np.isnan(ratings), 0.0, scores)
+
+
+def score_all(properties: Sequence[BookingProperty], criteria: TravelSearchCriteria) -> np.ndarray:
+    """Calculate match scores for a whole batch of properties.
+
+    Args:
+        properties: The properties to evaluate.
+        criteria: The search criteria to match against.
+
+    Returns:
+        Array of scores from 0-100, in the order of `properties`.
+    """
+    count = len(properties)
+    prices = np.fromiter((p.price for p in properties), dtype=np.float64, count=count)
+    ratings = np.fromiter((np.nan if p.rating is None else p.rating for p in properties), dtype=np.float64, count=count)
+    criteria_room_type = _criteria_room_type(criteria)
+    room_match = np.fromiter(
+        (bool(criteria_room_type and p.room_type_lower and criteria_room_type in p.room_type_lower) for p in properties),
+        dtype=np.bool_,
+        count=count,
+    )
+    has_price_range = criteria.min_price is not None and criteria.max_price is not None
+
+    if _NUMBA_AVAILABLE:
+        return _score_kernel(
+            prices,
+            ratings,
+            room_match,
+            has_price_range,
+            criteria.min_price if has_price_range else 0.0,
+            criteria.max_price if has_price_range else 0.0,
+            criteria.min_rating is not None,
+            criteria.min_rating if criteria.min_rating is not None else 0.0,
+        )
+
+    # Location match (base score) and room type match (up to 15 points)
+    scores = np.where(room_match, 65.0, 50.0)
+    if has_price_range:
+        scores += score_prices(prices, criteria.min_price, criteria.max_price)
+    if criteria.min_rating is not None:
+        scores += score_ratings(ratings, criteria.min_rating)
+    return np.clip(scores, 0.0, 100.0, out=scores)
@@ -8,20 +8,216 @@ To learn how to create a new tool, see:
 
 from __future__ import annotations
 
+import asyncio
+import functools
+from collections import OrderedDict
 import os
+import re
 from typing import Optional, Any
-import json
 
 from apify import Actor
-from apify_client import ApifyClient
+from apify_client import ApifyClientAsync
 from crewai.tools import BaseTool
 from crewai.utilities.converter import ValidationError
-from pydantic import BaseModel, Field, PrivateAttr
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter
 from langchain_community.chat_models import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 from langchain.output_parsers import PydanticOutputParser
+from langchain_core.exceptions import OutputParserException
 
-from src.models import BookingProperty, BookingProperties, TravelSearchCriteria
+from src.models import BookingProperty, TravelSearchCriteria
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Maximum number of memoized LLM extractions per extractor
+_EXTRACTION_CACHE_SIZE = 4096
+
+# Patterns for the common simple query shape, e.g. "hotels in New York under $200 4 stars"
+_SIMPLE_LOCATION_WORD = r'(?!(?:Under|Below|Above|Over|With|For|And|The|In|Near)\b)[A-Z][a-z]+'
+_SIMPLE_LOCATION_PATTERN = re.compile(rf'\bin ({_SIMPLE_LOCATION_WORD}(?: {_SIMPLE_LOCATION_WORD})*)')
+# Longer capitalized runs are more likely a place plus a landmark or area, left to the LLM
+_SIMPLE_LOCATION_MAX_WORDS = 3
+_SIMPLE_FIELD_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = (
+    ('max_price', re.compile(r'\b(?:under|below|less than) \$?(\d+)(?![\d.])', re.IGNORECASE)),
+    ('min_price', re.compile(r'\b(?:above|over|more than) \$?(\d+)(?![\d.])', re.IGNORECASE)),
+    ('min_rating', re.compile(r'(?<![\d.])([1-5])[ -]?stars?\b', re.IGNORECASE)),
+)
+# Words that carry no search parameter, anything else left over sends the query to the LLM
+_SIMPLE_FILLER_PATTERN = re.compile(
+    r'\b(?:a|an|the|me|find|show|looking|for|with|and|hotels?|accommodations?|places to stay|stays?|per night|night)\b|[,.!?]',
+    re.IGNORECASE,
+)
+
+# Raw dataset keys that map to BookingProperty fields, by alias or by name
+_PROPERTY_INPUT_KEYS = frozenset(
+    key
+    for name, field in BookingProperty.model_fields.items()
+    for key in (name, field.alias)
+    if key is not None
+)
+
+# Built once at import, validates a whole dataset in a single pydantic-core call
+_PROPERTY_LIST_ADAPTER: TypeAdapter[list[BookingProperty]] = TypeAdapter(list[BookingProperty])
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query so trivially different spellings share cache entries.
+
+    Args:
+        query: Natural language query string
+
+    Returns:
+        Lowercased query with surrounding whitespace stripped and inner whitespace collapsed
+    """
+    return _WHITESPACE_PATTERN.sub(' ', query.strip().lower())
+
+
+# Read once at import, the token does not change during the Actor run
+_APIFY_TOKEN: str | None = os.getenv('APIFY_TOKEN')
+
+_APIFY_CLIENT: ApifyClientAsync | None = None
+
+
+def _new_client() -> ApifyClientAsync:
+    """Create an Apify client, its HTTP connection pool binds to the event loop it first runs on."""
+    if not _APIFY_TOKEN:
+        Actor.log.error('APIFY_TOKEN environment variable is missing!')
+        raise ValueError('APIFY_TOKEN environment variable is missing!')
+    return ApifyClientAsync(token=_APIFY_TOKEN)
+
+
+def _get_client() -> ApifyClientAsync:
+    """Return the shared Apify client so its HTTP connection pool is reused across searches."""
+    global _APIFY_CLIENT
+    if _APIFY_CLIENT is None:
+        _APIFY_CLIENT = _new_client()
+    return _APIFY_CLIENT
+
+
+@functools.lru_cache(maxsize=256)
+def _build_run_input(criteria: TravelSearchCriteria) -> tuple[tuple[str, Any], ...]:
+    """Build the Booking.com scraper run input for the given criteria.
+
+    Args:
+        criteria: Search criteria, hashable since the model is frozen
+
+    Returns:
+        Run input items, as a tuple so the cached value cannot be mutated by callers
+    """
+    # Ensure price range is properly formatted
+    min_price = max(0, criteria.min_price if criteria.min_price is not None else 0)
+    max_price = max(min_price, criteria.max_price if criteria.max_price is not None else 999999)
+
+    run_input = {
+        'search': criteria.location.strip(),
+        'maxItems': min(100, max(1, criteria.max_results)),  # Ensure reasonable limits
+        'sortBy': 'distance_from_search',
+        'currency': criteria.currency.upper(),
+        'language': criteria.language.lower()
+    }
+
+    # Format price range as "min-max" if both values are available
+    if min_price is not None and max_price is not None:
+        run_input['minMaxPrice'] = f"{int(min_price)}-{int(max_price)}"
+    elif min_price is not None:
+        run_input['minPrice'] = str(min_price)
+    elif max_price is not None:
+        run_input['maxPrice'] = str(max_price)
+
+    # Add star rating filter if minimum rating is specified
+    if criteria.min_rating is not None:
+        # Convert float rating to integer stars (e.g., 4.0 becomes "4")
+        stars = int(criteria.min_rating)
+        if stars > 0 and stars <= 5:
+            run_input['starsCountFilter'] = str(stars)
+
+    return tuple(run_input.items())
+
+
+async def _call_scraper(apify_client: ApifyClientAsync, run_input: dict[str, Any]) -> dict | None:
+    """Run the Booking.com scraper and wait for it to finish, aborting the run if cancelled.
+
+    Cancelling the task only stops the local await, so without the abort a cancelled
+    search would keep running, and billing, on the platform.
+
+    Args:
+        apify_client: Apify client to run the scraper with
+        run_input: Run input for the scraper
+
+    Returns:
+        The finished run, or None if the API returned no run
+    """
+    # Shielded so a cancellation cannot lose the id of a run the start request already created
+    start_task = asyncio.ensure_future(apify_client.actor('voyager/booking-scraper').start(run_input=run_input))
+    try:
+        started_run = await asyncio.shield(start_task)
+    except asyncio.CancelledError:
+        started_run = await start_task
+        Actor.log.info(f'Search cancelled, aborting run {started_run["id"]}')
+        await apify_client.run(started_run['id']).abort()
+        raise
+
+    try:
+        return await apify_client.run(started_run['id']).wait_for_finish()
+    except asyncio.CancelledError:
+        Actor.log.info(f'Search cancelled, aborting run {started_run["id"]}')
+        await apify_client.run(started_run['id']).abort()
+        raise
+
+
+def _transform(item: dict, search_criteria: TravelSearchCriteria) -> dict:
+    """Prepare a raw Booking.com dataset item for validation.
+
+    Args:
+        item: Raw dataset item from the Booking.com scraper
+        search_criteria: Criteria the search was run with
+
+    Returns:
+        New item with only the keys BookingProperty uses, flattened location and defaulted price and currency
+    """
+    # Drop the many scraper keys the model ignores so validation does not walk them
+    item = {key: item[key] for key in _PROPERTY_INPUT_KEYS if key in item}
+
+    # Convert location coordinates to string address
+    if isinstance(item.get('location'), dict):
+        coords = item['location']
+        item['location'] = f"{item.get('address', {}).get('full', '')} (Lat: {coords.get('lat')}, Lng: {coords.get('lng')})"
+
+    # Ensure price and currency are properly set
+    if item.get('price') is None:
+        item['price'] = 0.0  # Default price
+    if item.get('currency') is None:
+        item['currency'] = search_criteria.currency  # Use search criteria currency as default
+    return item
+
+
+def parse_simple_query(query: str) -> TravelSearchCriteria | None:
+    """Parse a simple query without the LLM.
+
+    Args:
+        query: Natural language query string
+
+    Returns:
+        TravelSearchCriteria object if every part of the query was understood, None otherwise
+    """
+    if not (location_match := _SIMPLE_LOCATION_PATTERN.search(query)):
+        return None
+    if len(location_match.group(1).split()) > _SIMPLE_LOCATION_MAX_WORDS:
+        return None
+
+    remainder = f'{query[:location_match.start()]} {query[location_match.end():]}'
+    values: dict[str, float] = {}
+    for field, pattern in _SIMPLE_FIELD_PATTERNS:
+        if match := pattern.search(remainder):
+            values[field] = float(match.group(1))
+            remainder = f'{remainder[:match.start()]} {remainder[match.end():]}'
+
+    # Bail out on anything not understood, e.g. room types, room counts or dates
+    if _SIMPLE_FILLER_PATTERN.sub(' ', remainder).strip():
+        return None
+    if values.get('min_price', 0.0) > values.get('max_price', float('inf')):
+        return None
+    return TravelSearchCriteria(location=location_match.group(1), **values)
 
 
 class BookingScraperInput(BaseModel):
@@ -38,81 +234,45 @@ class BookingScraperTool(BaseTool):
     args_schema: type[BaseModel] = BookingScraperInput
 
     def _run(self, search_criteria: TravelSearchCriteria) -> list[BookingProperty]:
-        Actor.log.info(f'Initializing Booking.com search with criteria: {search_criteria}')
-        if not (token := os.getenv('APIFY_TOKEN')):
-            Actor.log.error('APIFY_TOKEN environment variable is missing!')
-            raise ValueError('APIFY_TOKEN environment variable is missing!')
+        # Every asyncio.run uses a new event loop, which cannot reuse the shared client's connection pool
+        return asyncio.run(self._search(_new_client(), search_criteria))
 
-        apify_client = ApifyClient(token=token)
+    async def _arun(self, search_criteria: TravelSearchCriteria) -> list[BookingProperty]:
+        return await self._search(_get_client(), search_criteria)
+
+    async def _search(self, apify_client: ApifyClientAsync, search_criteria: TravelSearchCriteria) -> list[BookingProperty]:
+        Actor.log.info(f'Initializing Booking.com search with criteria: {search_criteria}')
         # Validate and format search parameters
         if not search_criteria.location.strip():
             Actor.log.error('Location cannot be empty')
             raise ValueError('Location cannot be empty')
 
-        # Ensure price range is properly formatted
-        min_price = max(0, search_criteria.min_price if search_criteria.min_price is not None else 0)
-        max_price = max(min_price, search_criteria.max_price if search_criteria.max_price is not None else 999999)
-        
-        run_input = {
-            'search': search_criteria.location.strip(),
-            'maxItems': min(100, max(1, search_criteria.max_results)),  # Ensure reasonable limits
-            'sortBy': 'distance_from_search',
-            'currency': search_criteria.currency.upper(),
-            'language': search_criteria.language.lower()
-        }
-        
-        # Format price range as "min-max" if both values are available
-        if min_price is not None and max_price is not None:
-            run_input['minMaxPrice'] = f"{int(min_price)}-{int(max_price)}"
-        elif min_price is not None:
-            run_input['minPrice'] = str(min_price)
-        elif max_price is not None:
-            run_input['maxPrice'] = str(max_price)
-            
-        # Add star rating filter if minimum rating is specified
-        if search_criteria.min_rating is not None:
-            # Convert float rating to integer stars (e.g., 4.0 becomes "4")
-            stars = int(search_criteria.min_rating)
-            if stars > 0 and stars <= 5:
-                run_input['starsCountFilter'] = str(stars)
+        run_input = dict(_build_run_input(search_criteria))
 
         Actor.log.info(f'Configured search parameters: {run_input}')
         Actor.log.info(f'Starting Booking.com search for: {search_criteria.location}')
-        if not (run := apify_client.actor('voyager/booking-scraper').call(run_input=run_input)):
+        if not (run := await _call_scraper(apify_client, run_input)):
             Actor.log.error(f'Failed to search properties in {search_criteria.location}. API call returned no results.')
             raise RuntimeError(f'Failed to search properties in {search_criteria.location}')
 
         dataset_id = run['defaultDatasetId']
         Actor.log.info(f'Search completed. Processing dataset ID: {dataset_id}')
-        dataset_items: list[dict] = (apify_client.dataset(dataset_id).list_items()).items
-        Actor.log.info(f'Retrieved {len(dataset_items)} raw properties from Booking.com')
 
         try:
             Actor.log.info('Validating and processing property data...')
-            # Transform raw data before validation
-            for item in dataset_items:
-                # Convert location coordinates to string address
-                if isinstance(item.get('location'), dict):
-                    coords = item['location']
-                    item['location'] = f"{item.get('address', {}).get('full', '')} (Lat: {coords.get('lat')}, Lng: {coords.get('lng')})"
-                
-                # Ensure price and currency are properly set
-                if item.get('price') is None:
-                    item['price'] = 0.0  # Default price
-                if item.get('currency') is None:
-                    item['currency'] = search_criteria.currency  # Use search criteria currency as default
-
-            properties: BookingProperties = BookingProperties.model_validate(dataset_items)
-            if not properties.root:
+            # Transform each raw item as it is streamed from the dataset, then validate them all at once
+            dataset_items = [
+                _transform(item, search_criteria)
+                async for item in apify_client.dataset(dataset_id).iterate_items()
+            ]
+            properties: list[BookingProperty] = _PROPERTY_LIST_ADAPTER.validate_python(dataset_items)
+            if not properties:
                 Actor.log.warning('No properties found in the validated response')
                 return []
-            
-            Actor.log.info(f'Successfully validated {len(properties.root)} properties')
+
+            Actor.log.info(f'Successfully validated {len(properties)} properties')
             Actor.log.info('Returning all properties without additional filtering...')
-            
-            if len(properties.root) == 0:
-                Actor.log.warning('No properties found in the search results')
-            return properties.root
+            return properties
         except ValidationError as e:
             Actor.log.error(f'Data validation error for location {search_criteria.location}: {str(e)}')
             raise RuntimeError(f'Received invalid data for location {search_criteria.location}') from e
@@ -155,7 +315,10 @@ class SearchParameterExtractorTool(BaseTool):
             - Default language to "en"
             """),
             ("human", "{query}")
-        ])
+        ]).partial(format_instructions=self._parser.get_format_instructions())
+
+        # Memoized extractions keyed by normalized query, the LLM round-trip dominates this tool
+        self._extraction_cache: OrderedDict[str, TravelSearchCriteria] = OrderedDict()
 
     def _run(self, query: str) -> TravelSearchCriteria:
         """Extract search parameters from natural language query using LLM.
@@ -166,22 +329,16 @@ class SearchParameterExtractorTool(BaseTool):
         Returns:
             TravelSearchCriteria object with extracted parameters
         """
-        # Format the prompt with query and format instructions
-        formatted_prompt = self._prompt.format_messages(
-            query=query,
-            format_instructions=self._parser.get_format_instructions()
-        )
-        
-        # Get structured output from LLM
-        output = self._llm.invoke(formatted_prompt).content
-        
-        try:
-            # Parse the LLM output into TravelSearchCriteria
-            search_criteria = self._parser.parse(output)
-            Actor.log.info(f"Extracted parameters: {search_criteria}")
+        cache_key = normalize_query(query)
+        if (search_criteria := self._extraction_cache.get(cache_key)) is not None:
+            self._extraction_cache.move_to_end(cache_key)
             return search_criteria
-            
-        except Exception as e:
+
+        try:
+            # The original query goes to the LLM, normalizing would lose the case of place names
+            search_criteria = self._extract(query)
+
+        except OutputParserException as e:
             Actor.log.error(f"Failed to parse LLM output: {str(e)}")
             # Fallback to default values if parsing fails
             return TravelSearchCriteria(
@@ -193,4 +350,43 @@ class SearchParameterExtractorTool(BaseTool):
                 max_results=10,
                 currency="USD",
                 language="en"
-            )
\ No newline at end of file
+            )
+
+        self._extraction_cache[cache_key] = search_criteria
+        if len(self._extraction_cache) > _EXTRACTION_CACHE_SIZE:
+            self._extraction_cache.popitem(last=False)
+        return search_criteria
+
+    def _extract(self, query: str) -> TravelSearchCriteria:
+        """Run the LLM extraction for a query.
+
+        Parsing failures propagate so that they are never memoized.
+
+        Args:
+            query: Natural language query string
+
+        Returns:
+            TravelSearchCriteria object with extracted parameters
+        """
+        # Format the prompt with the query, format instructions are bound at initialization
+        formatted_prompt = self._prompt.format_messages(query=query)
+
+        # Get structured output from LLM
+        output = self._llm.invoke(formatted_prompt).content
+
+        # Parse the LLM output into TravelSearchCriteria
+        search_criteria = self._parser.parse(output)
+        Actor.log.info(f"Extracted parameters: {search_criteria}")
+        return search_criteria
+
+
+@functools.cache
+def get_booking_scraper() -> BookingScraperTool:
+    """Return the shared Booking.com scraper tool, created on first use."""
+    return BookingScraperTool()
+
+
+@functools.cache
+def get_search_parameter_extractor() -> SearchParameterExtractorTool:
+    """Return the shared search parameter extractor tool, created on first use."""
+    return SearchParameterExtractorTool()